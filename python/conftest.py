@@ -0,0 +1,36 @@
+import pytest
+
+# Mirrors the guarded imports in `test.py`: the availability of NumPy and SciPy
+# is decided once here, at collection time, instead of being re-evaluated by a
+# `skipif` condition attached to every single test. The naked `except:` matches
+# `test.py` — on some PyPy platforms a broken NumPy raises more than ImportError.
+try:
+    import numpy  # noqa: F401
+
+    numpy_available = True
+except:
+    numpy_available = False
+
+try:
+    import scipy.spatial.distance  # noqa: F401
+
+    scipy_available = True
+except:
+    scipy_available = False
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "needs_numpy: test requires NumPy to be installed")
+    config.addinivalue_line("markers", "needs_scipy: test requires SciPy to be installed")
+
+
+def pytest_collection_modifyitems(config, items):
+    if numpy_available and scipy_available:
+        return
+    skip_numpy = pytest.mark.skip(reason="NumPy is not installed")
+    skip_scipy = pytest.mark.skip(reason="SciPy is not installed")
+    for item in items:
+        if not numpy_available and "needs_numpy" in item.keywords:
+            item.add_marker(skip_numpy)
+        if not scipy_available and "needs_scipy" in item.keywords:
+            item.add_marker(skip_scipy)
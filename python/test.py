@@ -1,4 +1,6 @@
 import os
+import itertools
+
 import pytest
 import simsimd as simd
 
@@ -30,7 +32,10 @@ try:
 except:
     # SciPy is not installed, some tests will be skipped
     scipy_available = False
-    baseline_cosine = lambda x, y: 1.0 - np.dot(x, y) / (np.linalg.norm(x) * np.linalg.norm(y))
+    # Three plain dot-product reductions and one square root: cheaper than two
+    # `np.linalg.norm` calls, each with its own temporary and its own `sqrt`.
+    # The squared norms are multiplied in f64 - their f16 product can overflow.
+    baseline_cosine = lambda x, y: 1.0 - np.dot(x, y) / np.sqrt(np.float64(np.dot(x, x)) * np.float64(np.dot(y, y)))
     baseline_sqeuclidean = lambda x, y: np.sum((x - y) ** 2)
     baseline_jensenshannon = lambda p, q: np.sqrt((np.sum((np.sqrt(p) - np.sqrt(q)) ** 2)) / 2)
     baseline_hamming = lambda x, y: np.logical_xor(x, y).sum()
@@ -45,11 +50,107 @@ def is_running_under_qemu():
     return "SIMSIMD_IN_QEMU" in os.environ
 
 
+# A single shared Generator avoids re-seeding the legacy global RNG on every call,
+# and its `standard_normal`/`integers` are faster than the legacy `randn`/`randint`.
+# Set `SIMSIMD_TEST_SEED` for reproducible runs; by default we draw fresh OS entropy.
+if numpy_available:
+    SEED_ENTROPY = (
+        int(os.environ["SIMSIMD_TEST_SEED"]) if "SIMSIMD_TEST_SEED" in os.environ else np.random.SeedSequence().entropy
+    )
+    RNG = np.random.default_rng(SEED_ENTROPY)
+
+
+def pool_rng(*key):
+    """Derives a Generator whose stream depends only on the pool key and the base seed.
+
+    Pooled data then doesn't depend on which tests ran first in the process, so the
+    module can be split across `pytest-xdist` workers without changing what any
+    single test sees.
+    """
+    return np.random.default_rng([SEED_ENTROPY, *(int.from_bytes(str(part).encode(), "little") for part in key)])
+
+
 # For normalized distances we use the absolute tolerance, because the result is close to zero.
 # For unnormalized ones (like squared Euclidean or Jaccard), we use the relative.
 SIMSIMD_RTOL = 0.2
 SIMSIMD_ATOL = 0.15
 
+# Matches the `@pytest.mark.repeat(50)` count, so every repeat sees a distinct pair.
+SIMSIMD_POOL_SIZE = 50
+
+# Low-precision math isn't reliable under QEMU, so the f16 variants are pruned
+# at collection time instead of calling `pytest.skip` inside every test run.
+f16_unless_qemu = pytest.param(
+    "float16",
+    marks=pytest.mark.skipif(is_running_under_qemu(), reason="Testing low-precision math isn't reliable in QEMU"),
+)
+
+
+@pytest.fixture(scope="session")
+def rand_pool():
+    """Returns a getter for pools of pre-generated random operand pairs, keyed by `(ndim, dtype, kind)`.
+
+    Regenerating operands on every test invocation redoes identical RNG work for
+    every kernel sharing the same `(ndim, dtype)` parametrization. Instead we draw
+    two pools of 50 vectors once per key; tests either consume one pair per call,
+    cycling through the pool, or grab both pools wholesale with `batch=True` to
+    feed the batched kernel paths.
+    """
+    pools = {}
+
+    def draw(rng, ndim, dtype, kind):
+        if kind == "randn":
+            # `standard_normal` can fill f32/f64 buffers directly; only f16 needs a downcast.
+            if dtype in ("float64", "float32"):
+                return rng.standard_normal((SIMSIMD_POOL_SIZE, ndim), dtype=dtype)
+            return rng.standard_normal((SIMSIMD_POOL_SIZE, ndim), dtype=np.float32).astype(dtype)
+        elif kind == "int8":
+            return rng.integers(-128, 127, size=(SIMSIMD_POOL_SIZE, ndim), dtype=np.int8)
+        elif kind == "int8_positive":
+            return rng.integers(0, 100, size=(SIMSIMD_POOL_SIZE, ndim), dtype=np.int8)
+        raise ValueError(f"Unknown pool kind: {kind}")
+
+    def get(ndim, dtype, kind="randn", batch=False):
+        key = (ndim, dtype, kind)
+        if key not in pools:
+            rng = pool_rng(*key)
+            pools[key] = (
+                draw(rng, ndim, dtype, kind),
+                draw(rng, ndim, dtype, kind),
+                itertools.cycle(range(SIMSIMD_POOL_SIZE)),
+            )
+        a_pool, b_pool, indices = pools[key]
+        if batch:
+            return a_pool, b_pool
+        index = next(indices)
+        return a_pool[index], b_pool[index]
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def bits_pool():
+    """Returns a getter for pools of random bit-vectors with their `np.packbits` forms, keyed by `ndim`.
+
+    Packing costs about as much as the bitwise kernels under test, so both the
+    bits and their packed representation are produced once per shape instead of
+    on each of the 50 repeats.
+    """
+    pools = {}
+
+    def get(ndim):
+        if ndim not in pools:
+            rng = pool_rng(ndim, "bits")
+            a_bits = rng.integers(2, size=(SIMSIMD_POOL_SIZE, ndim), dtype=np.uint8)
+            b_bits = rng.integers(2, size=(SIMSIMD_POOL_SIZE, ndim), dtype=np.uint8)
+            packed = (np.packbits(a_bits, axis=1), np.packbits(b_bits, axis=1))
+            pools[ndim] = (a_bits, b_bits, *packed, itertools.cycle(range(SIMSIMD_POOL_SIZE)))
+        a_bits, b_bits, a_packed, b_packed, indices = pools[ndim]
+        index = next(indices)
+        return a_bits[index], b_bits[index], a_packed[index], b_packed[index]
+
+    return get
+
 
 def test_pointers_availability():
     """Tests the availability of pre-compiled functions for compatibility with USearch."""
@@ -90,82 +191,66 @@ def test_capabilities_list():
         simd.disable_capability("neon")
 
 
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
-@pytest.mark.repeat(50)
+@pytest.mark.needs_numpy
 @pytest.mark.parametrize("ndim", [11, 97, 1536])
-@pytest.mark.parametrize("dtype", ["float64", "float32", "float16"])
-def test_dot(ndim, dtype):
+@pytest.mark.parametrize("dtype", ["float64", "float32", f16_unless_qemu])
+def test_dot(ndim, dtype, rand_pool):
     """Compares the simd.dot() function with numpy.dot(), measuring the accuracy error for f64 and f32 types."""
 
-    if dtype == "float16" and is_running_under_qemu():
-        pytest.skip("Testing low-precision math isn't reliable in QEMU")
-
-    np.random.seed()
-    a = np.random.randn(ndim).astype(dtype)
-    b = np.random.randn(ndim).astype(dtype)
-    a /= np.linalg.norm(a)
-    b /= np.linalg.norm(b)
+    A, B = rand_pool(ndim, dtype, batch=True)
+    A = A / np.linalg.norm(A, axis=1, keepdims=True)
+    B = B / np.linalg.norm(B, axis=1, keepdims=True)
 
-    expected = np.inner(a, b).astype(np.float32)
-    result = simd.inner(a, b)
+    expected = np.einsum("ij,ij->i", A, B).astype(np.float32)
+    result = np.asarray(simd.inner(A, B))
 
     np.testing.assert_allclose(expected, result, atol=SIMSIMD_ATOL, rtol=0)
 
 
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
-@pytest.mark.repeat(50)
+@pytest.mark.needs_numpy
 @pytest.mark.parametrize("ndim", [11, 97, 1536])
 @pytest.mark.parametrize("dtype", ["int8"])
-def test_dot_integers(ndim, dtype):
+def test_dot_integers(ndim, dtype, rand_pool):
     """Compares the simd.dot() function with numpy.dot(), checking for exact match for integer inputs."""
 
-    np.random.seed()
-    a = np.random.randint(-128, 127, size=(ndim), dtype=dtype)
-    b = np.random.randint(-128, 127, size=(ndim), dtype=dtype)
+    A, B = rand_pool(ndim, dtype, kind="int8", batch=True)
 
-    expected_overflow = np.inner(a, b)
-    expected = np.inner(a.astype(np.int64), b.astype(np.int64))
-    result = simd.inner(a, b)
+    # One vectorized int64 reduction replaces the two per-row `np.inner` calls
+    # and their operand upcast copies. Overflow semantics differ between the
+    # batched and scalar paths, so the exact-match check stays per-pair; the
+    # overflowing product is only computed if the assertion message is needed.
+    expected = np.einsum("ij,ij->i", A, B, dtype=np.int64)
 
-    assert int(result) == expected, f"Expected {expected}, but got {result} (overflow: {expected_overflow})"
+    for i, (a, b) in enumerate(zip(A, B)):
+        result = simd.inner(a, b)
 
+        assert int(result) == expected[i], f"Expected {expected[i]}, but got {result} (overflow: {np.inner(a, b)})"
 
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
-@pytest.mark.repeat(50)
+
+@pytest.mark.needs_numpy
 @pytest.mark.parametrize("ndim", [11, 97, 1536])
-@pytest.mark.parametrize("dtype", ["float64", "float32", "float16"])
-def test_sqeuclidean(ndim, dtype):
+@pytest.mark.parametrize("dtype", ["float64", "float32", f16_unless_qemu])
+def test_sqeuclidean(ndim, dtype, rand_pool):
     """Compares the simd.sqeuclidean() function with scipy.spatial.distance.sqeuclidean(), measuring the accuracy error for f16, and f32 types."""
 
-    if dtype == "float16" and is_running_under_qemu():
-        pytest.skip("Testing low-precision math isn't reliable in QEMU")
-
-    np.random.seed()
-    a = np.random.randn(ndim).astype(dtype)
-    b = np.random.randn(ndim).astype(dtype)
+    A, B = rand_pool(ndim, dtype, batch=True)
 
-    expected = baseline_sqeuclidean(a, b).astype(np.float32)
-    result = simd.sqeuclidean(a, b)
+    expected = np.array([baseline_sqeuclidean(A[i], B[i]) for i in range(SIMSIMD_POOL_SIZE)], dtype=np.float32)
+    result = np.asarray(simd.sqeuclidean(A, B))
 
     np.testing.assert_allclose(expected, result, atol=0, rtol=SIMSIMD_RTOL)
 
 
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
-@pytest.mark.repeat(50)
+@pytest.mark.needs_numpy
 @pytest.mark.parametrize("ndim", [11, 97, 1536])
-@pytest.mark.parametrize("dtype", ["float64", "float32", "float16"])
-def test_cosine(ndim, dtype):
+@pytest.mark.parametrize("dtype", ["float64", "float32", f16_unless_qemu])
+def test_cosine(ndim, dtype, rand_pool):
     """Compares the simd.cosine() function with scipy.spatial.distance.cosine(), measuring the accuracy error for f16, and f32 types."""
 
-    if dtype == "float16" and is_running_under_qemu():
-        pytest.skip("Testing low-precision math isn't reliable in QEMU")
-
-    np.random.seed()
-    a = np.random.randn(ndim).astype(dtype)
-    b = np.random.randn(ndim).astype(dtype)
+    A, B = rand_pool(ndim, dtype, batch=True)
 
-    expected = baseline_cosine(a, b).astype(np.float32)
-    result = simd.cosine(a, b)
+    expected = np.array([baseline_cosine(A[i], B[i]) for i in range(SIMSIMD_POOL_SIZE)], dtype=np.float32)
+    result = np.asarray(simd.cosine(A, B))
 
     np.testing.assert_allclose(expected, result, atol=SIMSIMD_ATOL, rtol=0)
 
@@ -176,9 +261,8 @@ def test_cosine(ndim, dtype):
 @pytest.mark.parametrize("dtype", ["float32", "float16"])
 def test_jensen_shannon(ndim, dtype):
     """Compares the simd.jensenshannon() function with scipy.spatial.distance.jensenshannon(), measuring the accuracy error for f16, and f32 types."""
-    np.random.seed()
-    a = np.abs(np.random.randn(ndim)).astype(dtype)
-    b = np.abs(np.random.randn(ndim)).astype(dtype)
+    a = np.abs(RNG.standard_normal(ndim)).astype(dtype)
+    b = np.abs(RNG.standard_normal(ndim)).astype(dtype)
     a /= np.sum(a)
     b /= np.sum(b)
 
@@ -188,43 +272,47 @@ def test_jensen_shannon(ndim, dtype):
     np.testing.assert_allclose(expected, result, atol=SIMSIMD_ATOL, rtol=0)
 
 
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
-@pytest.mark.repeat(50)
+@pytest.mark.needs_numpy
 @pytest.mark.parametrize("ndim", [11, 97, 1536])
-def test_cosine_i8(ndim):
+def test_cosine_i8(ndim, rand_pool):
     """Compares the simd.cosine() function with scipy.spatial.distance.cosine(), measuring the accuracy error for 8-bit int types."""
-    np.random.seed()
-    a = np.random.randint(0, 100, size=ndim, dtype=np.int8)
-    b = np.random.randint(0, 100, size=ndim, dtype=np.int8)
+    A, B = rand_pool(ndim, "int8", kind="int8_positive", batch=True)
 
-    expected = baseline_cosine(a.astype(np.float32), b.astype(np.float32))
-    result = simd.cosine(a, b)
+    # Accumulating the integer products in int64 through `einsum` avoids the
+    # per-row float32 upcast copies the SciPy baseline would require.
+    ab = np.einsum("ij,ij->i", A, B, dtype=np.int64)
+    a2 = np.einsum("ij,ij->i", A, A, dtype=np.int64)
+    b2 = np.einsum("ij,ij->i", B, B, dtype=np.int64)
+    expected = 1.0 - ab / np.sqrt(a2 * b2)
+    result = np.asarray(simd.cosine(A, B))
 
     np.testing.assert_allclose(expected, result, atol=SIMSIMD_ATOL, rtol=0)
 
 
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
-@pytest.mark.repeat(50)
+@pytest.mark.needs_numpy
 @pytest.mark.parametrize("ndim", [11, 97, 1536])
-def test_sqeuclidean_i8(ndim):
+def test_sqeuclidean_i8(ndim, rand_pool):
     """Compares the simd.sqeuclidean() function with scipy.spatial.distance.sqeuclidean(), measuring the accuracy error for 8-bit int types."""
-    np.random.seed()
-    a = np.random.randint(0, 100, size=ndim, dtype=np.int8)
-    b = np.random.randint(0, 100, size=ndim, dtype=np.int8)
+    A, B = rand_pool(ndim, "int8", kind="int8_positive", batch=True)
 
-    expected = baseline_sqeuclidean(a.astype(np.float32), b.astype(np.float32))
-    result = simd.sqeuclidean(a, b)
+    # The exact integer distances expand to `a.a - 2 a.b + b.b`, accumulated in
+    # int64 through `einsum` to sidestep the per-row float32 upcast copies.
+    ab = np.einsum("ij,ij->i", A, B, dtype=np.int64)
+    a2 = np.einsum("ij,ij->i", A, A, dtype=np.int64)
+    b2 = np.einsum("ij,ij->i", B, B, dtype=np.int64)
+    expected = a2 - 2 * ab + b2
+    result = np.asarray(simd.sqeuclidean(A, B))
 
     np.testing.assert_allclose(expected, result, atol=0, rtol=SIMSIMD_RTOL)
 
 
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
+@pytest.mark.needs_numpy
 @pytest.mark.parametrize("ndim", [11, 97, 1536])
 @pytest.mark.parametrize("dtype", ["float32", "float16"])
-def test_cosine_zero_vector(ndim, dtype):
+def test_cosine_zero_vector(ndim, dtype, rand_pool):
     """Tests the simd.cosine() function with zero vectors, to catch division by zero errors."""
     a = np.zeros(ndim, dtype=dtype)
-    b = np.random.randn(ndim).astype(dtype)
+    _, b = rand_pool(ndim, dtype)
 
     expected = 1
     result = simd.cosine(a, b)
@@ -233,16 +321,18 @@ def test_cosine_zero_vector(ndim, dtype):
 
 
 @pytest.mark.skipif(is_running_under_qemu(), reason="Complex math in QEMU fails")
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
+@pytest.mark.needs_numpy
 @pytest.mark.repeat(50)
 @pytest.mark.parametrize("ndim", [22, 66, 1536])
 @pytest.mark.parametrize("dtype", ["float32", "float64"])
-def test_dot_complex(ndim, dtype):
+def test_dot_complex(ndim, dtype, rand_pool):
     """Compares the simd.dot() and simd.vdot() against NumPy for complex numbers."""
-    np.random.seed()
+    # Complex views over the pooled float pairs are free, so the repeats reuse
+    # the per-(ndim, dtype) pool instead of regenerating operands every call.
     dtype_view = np.complex64 if dtype == "float32" else np.complex128
-    a = np.random.randn(ndim).astype(dtype=dtype).view(dtype_view)
-    b = np.random.randn(ndim).astype(dtype=dtype).view(dtype_view)
+    a, b = rand_pool(ndim, dtype)
+    a = a.view(dtype_view)
+    b = b.view(dtype_view)
 
     expected = np.dot(a, b)
     result = simd.dot(a, b)
@@ -256,14 +346,12 @@ def test_dot_complex(ndim, dtype):
 
 
 @pytest.mark.skipif(is_running_under_qemu(), reason="Complex math in QEMU fails")
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
+@pytest.mark.needs_numpy
 @pytest.mark.repeat(50)
 @pytest.mark.parametrize("ndim", [22, 66, 1536])
-def test_dot_complex_explicit(ndim):
+def test_dot_complex_explicit(ndim, rand_pool):
     """Compares the simd.dot() and simd.vdot() against NumPy for complex numbers."""
-    np.random.seed()
-    a = np.random.randn(ndim).astype(dtype=np.float32)
-    b = np.random.randn(ndim).astype(dtype=np.float32)
+    a, b = rand_pool(ndim, "float32")
 
     expected = np.dot(a.view(np.complex64), b.view(np.complex64))
     result = simd.dot(a, b, "complex64")
@@ -276,100 +364,90 @@ def test_dot_complex_explicit(ndim):
     np.testing.assert_allclose(expected, result, atol=0, rtol=SIMSIMD_RTOL)
 
 
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
+@pytest.mark.needs_numpy
 @pytest.mark.repeat(50)
 @pytest.mark.parametrize("ndim", [11, 97, 1536])
-def test_hamming(ndim):
+def test_hamming(ndim, bits_pool):
     """Compares the simd.hamming() function with scipy.spatial.distance.hamming."""
-    np.random.seed()
-    a = np.random.randint(2, size=ndim).astype(np.uint8)
-    b = np.random.randint(2, size=ndim).astype(np.uint8)
+    a, b, a_packed, b_packed = bits_pool(ndim)
 
     expected = baseline_hamming(a, b)
-    result = simd.hamming(np.packbits(a), np.packbits(b))
+    result = simd.hamming(a_packed, b_packed)
 
     np.testing.assert_allclose(expected, result, atol=0, rtol=SIMSIMD_RTOL)
 
 
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
+@pytest.mark.needs_numpy
 @pytest.mark.repeat(50)
 @pytest.mark.parametrize("ndim", [11, 97, 1536])
-def test_jaccard(ndim):
+def test_jaccard(ndim, bits_pool):
     """Compares the simd.jaccard() function with scipy.spatial.distance.jaccard."""
-    np.random.seed()
-    a = np.random.randint(2, size=ndim).astype(np.uint8)
-    b = np.random.randint(2, size=ndim).astype(np.uint8)
+    a, b, a_packed, b_packed = bits_pool(ndim)
 
     expected = baseline_jaccard(a, b)
-    result = simd.jaccard(np.packbits(a), np.packbits(b))
+    result = simd.jaccard(a_packed, b_packed)
 
     np.testing.assert_allclose(expected, result, atol=SIMSIMD_ATOL, rtol=0)
 
 
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
-@pytest.mark.skipif(not scipy_available, reason="SciPy is not installed")
+@pytest.mark.needs_numpy
+@pytest.mark.needs_scipy
 @pytest.mark.parametrize("ndim", [11, 97, 1536])
-@pytest.mark.parametrize("dtype", ["float64", "float32", "float16"])
-def test_batch(ndim, dtype):
+@pytest.mark.parametrize("dtype", ["float64", "float32", f16_unless_qemu])
+def test_batch(ndim, dtype, rand_pool):
     """Compares the simd.simd.sqeuclidean() function with scipy.spatial.distance.sqeuclidean() for a batch of vectors, measuring the accuracy error for f16, and f32 types."""
 
-    if dtype == "float16" and is_running_under_qemu():
-        pytest.skip("Testing low-precision math isn't reliable in QEMU")
-
-    np.random.seed()
+    # All five broadcasting scenarios reuse the same two pooled matrices: slicing
+    # yields the single-row and flat-vector operands without regeneration,
+    # and one scratch buffer collects the baseline distances for each scenario.
+    A, B = rand_pool(ndim, dtype, batch=True)
+    A, B = A[:10], B[:10]
+    result_np = np.empty(10)
 
     # Distance between matrixes A (N x D scalars) and B (N x D scalars) is an array with N floats.
-    A = np.random.randn(10, ndim).astype(dtype)
-    B = np.random.randn(10, ndim).astype(dtype)
-    result_np = [spd.sqeuclidean(A[i], B[i]) for i in range(10)]
+    for i in range(10):
+        result_np[i] = spd.sqeuclidean(A[i], B[i])
     result_simd = simd.sqeuclidean(A, B)
-    assert np.allclose(result_simd, result_np, atol=0, rtol=SIMSIMD_RTOL)
+    np.testing.assert_allclose(result_simd, result_np, atol=0, rtol=SIMSIMD_RTOL)
 
     # Distance between matrixes A (N x D scalars) and B (1 x D scalars) is an array with N floats.
-    B = np.random.randn(1, ndim).astype(dtype)
-    result_np = [spd.sqeuclidean(A[i], B[0]) for i in range(10)]
-    result_simd = simd.sqeuclidean(A, B)
-    assert np.allclose(result_simd, result_np, atol=0, rtol=SIMSIMD_RTOL)
+    for i in range(10):
+        result_np[i] = spd.sqeuclidean(A[i], B[0])
+    result_simd = simd.sqeuclidean(A, B[:1])
+    np.testing.assert_allclose(result_simd, result_np, atol=0, rtol=SIMSIMD_RTOL)
 
     # Distance between matrixes A (1 x D scalars) and B (N x D scalars) is an array with N floats.
-    A = np.random.randn(1, ndim).astype(dtype)
-    B = np.random.randn(10, ndim).astype(dtype)
-    result_np = [spd.sqeuclidean(A[0], B[i]) for i in range(10)]
-    result_simd = simd.sqeuclidean(A, B)
-    assert np.allclose(result_simd, result_np, atol=0, rtol=SIMSIMD_RTOL)
+    for i in range(10):
+        result_np[i] = spd.sqeuclidean(A[0], B[i])
+    result_simd = simd.sqeuclidean(A[:1], B)
+    np.testing.assert_allclose(result_simd, result_np, atol=0, rtol=SIMSIMD_RTOL)
 
     # Distance between matrix A (N x D scalars) and array B (D scalars) is an array with N floats.
-    A = np.random.randn(10, ndim).astype(dtype)
-    B = np.random.randn(ndim).astype(dtype)
-    result_np = [spd.sqeuclidean(A[i], B) for i in range(10)]
-    result_simd = simd.sqeuclidean(A, B)
-    assert np.allclose(result_simd, result_np, atol=0, rtol=SIMSIMD_RTOL)
+    for i in range(10):
+        result_np[i] = spd.sqeuclidean(A[i], B[0])
+    result_simd = simd.sqeuclidean(A, B[0])
+    np.testing.assert_allclose(result_simd, result_np, atol=0, rtol=SIMSIMD_RTOL)
 
     # Distance between matrix B (N x D scalars) and array A (D scalars) is an array with N floats.
-    B = np.random.randn(10, ndim).astype(dtype)
-    A = np.random.randn(ndim).astype(dtype)
-    result_np = [spd.sqeuclidean(B[i], A) for i in range(10)]
-    result_simd = simd.sqeuclidean(B, A)
-    assert np.allclose(result_simd, result_np, atol=0, rtol=SIMSIMD_RTOL)
+    for i in range(10):
+        result_np[i] = spd.sqeuclidean(B[i], A[0])
+    result_simd = simd.sqeuclidean(B, A[0])
+    np.testing.assert_allclose(result_simd, result_np, atol=0, rtol=SIMSIMD_RTOL)
 
 
-@pytest.mark.skipif(not numpy_available, reason="NumPy is not installed")
-@pytest.mark.skipif(not scipy_available, reason="SciPy is not installed")
+@pytest.mark.needs_numpy
+@pytest.mark.needs_scipy
 @pytest.mark.parametrize("ndim", [11, 97, 1536])
-@pytest.mark.parametrize("dtype", ["float32", "float16"])
+@pytest.mark.parametrize("dtype", ["float32", f16_unless_qemu])
 @pytest.mark.parametrize("metric", ["cosine"])
-def test_cdist(ndim, dtype, metric):
+def test_cdist(ndim, dtype, metric, rand_pool):
     """Compares the simd.cdist() function with scipy.spatial.distance.cdist(), measuring the accuracy error for f16, and f32 types using sqeuclidean and cosine metrics."""
 
-    if dtype == "float16" and is_running_under_qemu():
-        pytest.skip("Testing low-precision math isn't reliable in QEMU")
-
-    np.random.seed()
-
-    # Create random matrices A (M x D) and B (N x D).
+    # Slice matrices A (M x D) and B (N x D) from the shared pools, so every
+    # metric parametrization of the same (ndim, dtype) reuses the same operands.
     M, N = 10, 15  # or any other sizes you deem appropriate
-    A = np.random.randn(M, ndim).astype(dtype)
-    B = np.random.randn(N, ndim).astype(dtype)
+    A_pool, B_pool = rand_pool(ndim, dtype, batch=True)
+    A, B = A_pool[:M], B_pool[:N]
 
     # Compute cdist using scipy.
     expected = spd.cdist(A, B, metric)